@@ -13,17 +13,17 @@
 # COMMAND ----------
 
 import json
+import orjson
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import pyarrow as pa
+import pyarrow.feather as feather
 from datetime import datetime, timedelta
 import numpy as np
+import sys
 from pathlib import Path
 
-# Configure plotting
-plt.style.use('default')
-sns.set_palette("husl")
-plt.rcParams['figure.figsize'] = (12, 8)
+# Make the collector modules importable, both for fresh collection and for reading its Parquet output
+sys.path.append('/Workspace/Repos/workspace-management/src')
 
 # COMMAND ----------
 
@@ -56,20 +56,33 @@ print(f"Analysis Type: {analysis_type}")
 # COMMAND ----------
 
 def load_metadata(file_path=None, catalog_name=None, schema_name=None):
-    """Load metadata either from file or collect fresh data"""
+    """Load metadata either from file or collect fresh data, returning the metadata and a tables DataFrame"""
+    
+    if file_path:
+        # Prefer Parquet output, given directly or written next to the JSON file by --format both
+        parquet_path = Path(file_path).with_suffix('.parquet')
+        if parquet_path.exists():
+            try:
+                # results_io needs only orjson and pyarrow, not the Databricks client
+                from results_io import load_results_parquet
+            except ImportError:
+                if parquet_path == Path(file_path):
+                    raise
+                print(f"Cannot import results_io, reading {file_path} instead of {parquet_path}")
+            else:
+                print(f"Loading metadata from Parquet file: {parquet_path}")
+                metadata, columns = load_results_parquet(str(parquet_path))
+                return metadata, pd.DataFrame(columns)
     
     if file_path and Path(file_path).exists():
         print(f"Loading metadata from file: {file_path}")
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        metadata = orjson.loads(Path(file_path).read_bytes())
+        return metadata, pd.DataFrame(metadata.pop('tables', []))
     
     elif catalog_name and schema_name:
         print(f"Collecting fresh metadata for {catalog_name}.{schema_name}")
         
         # Import and run the metadata collector
-        import sys
-        sys.path.append('/Workspace/Repos/workspace-management/src')
-        
         from metadata_collector import MetadataCollector
         from config import MetadataConfig
         
@@ -80,19 +93,20 @@ def load_metadata(file_path=None, catalog_name=None, schema_name=None):
         )
         
         collector = MetadataCollector(config)
-        return collector.collect_metadata()
+        metadata = collector.collect_metadata()
+        return metadata, pd.DataFrame(metadata['tables'])
     
     else:
         raise ValueError("Either provide metadata_file path or catalog/schema names")
 
 # Load the metadata
-metadata = load_metadata(
+metadata, tables_df = load_metadata(
     file_path=metadata_file if metadata_file else None,
     catalog_name=catalog if not metadata_file else None,
     schema_name=schema if not metadata_file else None
 )
 
-print(f"Loaded metadata for {len(metadata.get('tables', []))} tables")
+print(f"Loaded metadata for {len(tables_df)} tables")
 
 # COMMAND ----------
 
@@ -101,25 +115,56 @@ print(f"Loaded metadata for {len(metadata.get('tables', []))} tables")
 
 # COMMAND ----------
 
-# Convert to DataFrame for easier analysis
-tables_df = pd.DataFrame(metadata.get('tables', []))
+def top_n(df, column, n):
+    """Return the n rows with the largest values in column, in descending order, without sorting the whole frame"""
+    values = df[column].to_numpy(dtype='float64')
+    if len(values) > n:
+        indices = np.argpartition(-values, n - 1)[:n]
+    else:
+        indices = np.arange(len(values))
+    indices = indices[np.argsort(-values[indices], kind='stable')]
+    return df.iloc[indices]
+
+def parse_timestamps(values):
+    """Parse ISO-8601 timestamps on the fast path, re-parsing any other text (e.g. from older metadata files) value by value"""
+    parsed = pd.to_datetime(values, format='ISO8601', errors='coerce', utc=True)
+    leftover = parsed.isna() & values.notna()
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(values[leftover], format='mixed', errors='coerce', utc=True)
+    return parsed
+
 summary = metadata.get('summary', {})
+n_total = len(tables_df)
+n_with = n_empty = 0
 
 if not tables_df.empty:
-    # Clean and process data
-    tables_df['size_mb'] = tables_df['size_bytes'].fillna(0) / (1024 * 1024)
-    tables_df['size_gb'] = tables_df['size_bytes'].fillna(0) / (1024 * 1024 * 1024)
-    tables_df['row_count'] = tables_df['row_count'].fillna(0)
-    tables_df['has_data'] = tables_df['row_count'] > 0
+    # Clean and process data, filling each source column once and deriving the rest from it
+    size_bytes = tables_df['size_bytes'].fillna(0).to_numpy(dtype='float64')
+    row_count = tables_df['row_count'].fillna(0)
+    tables_df = tables_df.assign(
+        size_mb=size_bytes / (1 << 20),
+        size_gb=size_bytes / (1 << 30),
+        row_count=row_count,
+        has_data=row_count > 0
+    )
+    
+    # Count tables with and without data once for every cell below
+    n_with = int(tables_df['has_data'].to_numpy().sum())
+    n_empty = n_total - n_with
+    
+    # Low-cardinality string columns are stored as categoricals, so counting works on integer codes
+    for column in ('table_type', 'data_source_format'):
+        if column in tables_df.columns:
+            tables_df[column] = tables_df[column].astype('category')
     
     # Parse timestamps
     if 'created_at' in tables_df.columns:
-        tables_df['created_at'] = pd.to_datetime(tables_df['created_at'], errors='coerce')
+        tables_df['created_at'] = parse_timestamps(tables_df['created_at'])
     if 'last_updated' in tables_df.columns:
-        tables_df['last_updated'] = pd.to_datetime(tables_df['last_updated'], errors='coerce')
+        tables_df['last_updated'] = parse_timestamps(tables_df['last_updated'])
     
-    print(f"Processed {len(tables_df)} tables")
-    print(f"Tables with data: {tables_df['has_data'].sum()}")
+    print(f"Processed {n_total} tables")
+    print(f"Tables with data: {n_with}")
 else:
     print("No table data found!")
 
@@ -138,11 +183,11 @@ if analysis_type in ["overview", "detailed"]:
     print(f"Catalog: {metadata['catalog']}")
     print(f"Schema: {metadata['schema']}")
     print(f"Collection Time: {metadata['collection_timestamp']}")
-    print(f"Total Tables: {len(tables_df)}")
+    print(f"Total Tables: {n_total}")
     
     if not tables_df.empty:
-        print(f"Tables with Data: {tables_df['has_data'].sum()}")
-        print(f"Empty Tables: {(~tables_df['has_data']).sum()}")
+        print(f"Tables with Data: {n_with}")
+        print(f"Empty Tables: {n_empty}")
         print(f"Total Size: {tables_df['size_gb'].sum():.2f} GB")
         print(f"Total Rows: {tables_df['row_count'].sum():,.0f}")
         
@@ -156,7 +201,30 @@ if analysis_type in ["overview", "detailed"]:
 
 # COMMAND ----------
 
-if not tables_df.empty and analysis_type in ["overview", "detailed"]:
+def setup_plotting():
+    """Import the plotting libraries on first use and apply the notebook's plot style"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    plt.style.use('default')
+    sns.set_palette("husl")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    return plt
+
+def plot_histogram(ax, values, log_bins=False, **bar_kwargs):
+    """Bin values once with np.histogram and draw the counts as bars"""
+    values = np.asarray(values, dtype='float64')
+    bins = 20
+    if log_bins and values.min() < values.max():
+        bins = np.logspace(np.log10(values.min()), np.log10(values.max()), 21)
+    counts, edges = np.histogram(values, bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **bar_kwargs)
+
+if not tables_df.empty and len(tables_df) < 4 and analysis_type in ["overview", "detailed"]:
+    print("Too few tables to chart, see the overview numbers above")
+
+elif not tables_df.empty and analysis_type in ["overview", "detailed"]:
+    plt = setup_plotting()
     
     # Create subplots
     fig, axes = plt.subplots(2, 2, figsize=(16, 12))
@@ -165,7 +233,7 @@ if not tables_df.empty and analysis_type in ["overview", "detailed"]:
     # 1. Table size distribution
     non_zero_sizes = tables_df[tables_df['size_gb'] > 0]['size_gb']
     if len(non_zero_sizes) > 0:
-        axes[0, 0].hist(non_zero_sizes, bins=20, alpha=0.7, color='skyblue', edgecolor='black')
+        plot_histogram(axes[0, 0], non_zero_sizes, alpha=0.7, color='skyblue', edgecolor='black')
         axes[0, 0].set_title('Table Size Distribution (GB)')
         axes[0, 0].set_xlabel('Size (GB)')
         axes[0, 0].set_ylabel('Number of Tables')
@@ -177,7 +245,7 @@ if not tables_df.empty and analysis_type in ["overview", "detailed"]:
     # 2. Row count distribution
     non_zero_rows = tables_df[tables_df['row_count'] > 0]['row_count']
     if len(non_zero_rows) > 0:
-        axes[0, 1].hist(non_zero_rows, bins=20, alpha=0.7, color='lightgreen', edgecolor='black')
+        plot_histogram(axes[0, 1], non_zero_rows, log_bins=True, alpha=0.7, color='lightgreen', edgecolor='black')
         axes[0, 1].set_title('Row Count Distribution')
         axes[0, 1].set_xlabel('Number of Rows')
         axes[0, 1].set_ylabel('Number of Tables')
@@ -225,15 +293,15 @@ if not tables_df.empty and analysis_type in ["overview", "detailed"]:
     
     print("TOP 10 LARGEST TABLES BY SIZE")
     print("-" * 50)
-    largest_tables = tables_df.nlargest(10, 'size_gb')[['table', 'size_gb', 'row_count', 'table_type']]
-    for _, row in largest_tables.iterrows():
-        print(f"{row['table']:<30} {row['size_gb']:>8.2f} GB {row['row_count']:>12,.0f} rows ({row['table_type']})")
+    largest_tables = top_n(tables_df, 'size_gb', 10)[['table', 'size_gb', 'row_count', 'table_type']]
+    for row in largest_tables.itertuples(index=False):
+        print(f"{row.table:<30} {row.size_gb:>8.2f} GB {row.row_count:>12,.0f} rows ({row.table_type})")
     
     print("\nTOP 10 TABLES BY ROW COUNT")
     print("-" * 50)
-    most_rows = tables_df.nlargest(10, 'row_count')[['table', 'row_count', 'size_gb', 'table_type']]
-    for _, row in most_rows.iterrows():
-        print(f"{row['table']:<30} {row['row_count']:>12,.0f} rows {row['size_gb']:>8.2f} GB ({row['table_type']})")
+    most_rows = top_n(tables_df, 'row_count', 10)[['table', 'row_count', 'size_gb', 'table_type']]
+    for row in most_rows.itertuples(index=False):
+        print(f"{row.table:<30} {row.row_count:>12,.0f} rows {row.size_gb:>8.2f} GB ({row.table_type})")
 
 # COMMAND ----------
 
@@ -252,39 +320,33 @@ if analysis_type in ["usage", "detailed"] and not tables_df.empty:
         print("-" * 50)
         
         # Extract usage statistics
-        usage_data = []
-        for _, row in tables_df.iterrows():
-            if pd.notna(row.get('usage_stats')) and row['usage_stats']:
-                usage_stats = row['usage_stats']
-                usage_data.append({
-                    'table': row['table'],
-                    'access_count': usage_stats.get('access_count', 0),
-                    'unique_users': usage_stats.get('unique_users', 0),
-                    'last_accessed': usage_stats.get('last_accessed')
-                })
+        has_usage = tables_df['usage_stats'].map(lambda stats: isinstance(stats, dict) and bool(stats))
+        usage_df = pd.json_normalize(tables_df.loc[has_usage, 'usage_stats'].tolist())
+        usage_df = usage_df.reindex(columns=['access_count', 'unique_users', 'last_accessed'])
+        usage_df[['access_count', 'unique_users']] = usage_df[['access_count', 'unique_users']].fillna(0)
+        usage_df.insert(0, 'table', tables_df.loc[has_usage, 'table'].to_numpy())
         
-        if usage_data:
-            usage_df = pd.DataFrame(usage_data)
-            
+        if not usage_df.empty:
             # Most accessed tables
             print("TOP 10 MOST ACCESSED TABLES")
             print("-" * 40)
-            top_accessed = usage_df.nlargest(10, 'access_count')
-            for _, row in top_accessed.iterrows():
-                print(f"{row['table']:<30} {row['access_count']:>6} accesses, {row['unique_users']:>3} users")
+            top_accessed = top_n(usage_df, 'access_count', 10)
+            for row in top_accessed.itertuples(index=False):
+                print(f"{row.table:<30} {row.access_count:>6} accesses, {row.unique_users:>3} users")
             
-            # Create usage visualization
-            if len(usage_df) > 0:
+            # Create usage visualization, skipped when there are too few tables to chart
+            if len(usage_df) >= 4:
+                plt = setup_plotting()
                 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
                 
                 # Access count distribution
-                ax1.hist(usage_df['access_count'], bins=20, alpha=0.7, color='lightblue', edgecolor='black')
+                plot_histogram(ax1, usage_df['access_count'], alpha=0.7, color='lightblue', edgecolor='black')
                 ax1.set_title('Table Access Count Distribution')
                 ax1.set_xlabel('Access Count')
                 ax1.set_ylabel('Number of Tables')
                 
                 # Unique users distribution
-                ax2.hist(usage_df['unique_users'], bins=20, alpha=0.7, color='lightcoral', edgecolor='black')
+                plot_histogram(ax2, usage_df['unique_users'], alpha=0.7, color='lightcoral', edgecolor='black')
                 ax2.set_title('Unique Users per Table Distribution')
                 ax2.set_xlabel('Unique Users')
                 ax2.set_ylabel('Number of Tables')
@@ -308,25 +370,29 @@ if analysis_type == "detailed" and not tables_df.empty:
     print("DETAILED TABLE INFORMATION")
     print("=" * 80)
     
-    # Sort by size for detailed view
-    detailed_df = tables_df.sort_values('size_gb', ascending=False)
+    # Largest tables by size for detailed view
+    detailed_df = top_n(tables_df, 'size_gb', 20)
+    
+    detail_columns = ['table', 'table_type', 'owner', 'size_gb', 'size_mb', 'row_count',
+                      'data_source_format', 'created_at', 'last_updated', 'location', 'comment']
+    detailed_df = detailed_df.reindex(columns=detail_columns)
     
-    for _, row in detailed_df.head(20).iterrows():  # Show top 20 tables
-        print(f"\nTable: {row['table']}")
-        print(f"  Type: {row.get('table_type', 'Unknown')}")
-        print(f"  Owner: {row.get('owner', 'Unknown')}")
-        print(f"  Size: {row['size_gb']:.2f} GB ({row['size_mb']:.2f} MB)")
-        print(f"  Rows: {row['row_count']:,.0f}")
-        print(f"  Format: {row.get('data_source_format', 'Unknown')}")
+    for row in detailed_df.itertuples(index=False):
+        print(f"\nTable: {row.table}")
+        print(f"  Type: {row.table_type if pd.notna(row.table_type) else 'Unknown'}")
+        print(f"  Owner: {row.owner if pd.notna(row.owner) else 'Unknown'}")
+        print(f"  Size: {row.size_gb:.2f} GB ({row.size_mb:.2f} MB)")
+        print(f"  Rows: {row.row_count:,.0f}")
+        print(f"  Format: {row.data_source_format if pd.notna(row.data_source_format) else 'Unknown'}")
         
-        if pd.notna(row.get('created_at')):
-            print(f"  Created: {row['created_at']}")
-        if pd.notna(row.get('last_updated')):
-            print(f"  Last Updated: {row['last_updated']}")
-        if row.get('location'):
-            print(f"  Location: {row['location']}")
-        if row.get('comment'):
-            print(f"  Comment: {row['comment']}")
+        if pd.notna(row.created_at):
+            print(f"  Created: {row.created_at}")
+        if pd.notna(row.last_updated):
+            print(f"  Last Updated: {row.last_updated}")
+        if pd.notna(row.location) and row.location:
+            print(f"  Location: {row.location}")
+        if pd.notna(row.comment) and row.comment:
+            print(f"  Comment: {row.comment}")
 
 # COMMAND ----------
 
@@ -338,30 +404,42 @@ if analysis_type == "detailed" and not tables_df.empty:
 # Export processed data
 output_path = f"/tmp/metadata_analysis_{catalog}_{schema}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+# Aggregate each column once, the export and the recommendations below reuse the results
+if not tables_df.empty:
+    size_stats = tables_df['size_gb'].agg(['sum', 'mean', 'median', 'max'])
+    row_stats = tables_df['row_count'].agg(['sum', 'max'])
+    largest_table = tables_df['table'].iat[tables_df['size_gb'].to_numpy().argmax()]
+    most_rows_table = tables_df['table'].iat[tables_df['row_count'].to_numpy().argmax()]
+
 # Save summary statistics
 summary_stats = {
     'catalog': catalog,
     'schema': schema,
     'analysis_timestamp': datetime.now().isoformat(),
-    'total_tables': len(tables_df),
-    'tables_with_data': tables_df['has_data'].sum() if not tables_df.empty else 0,
-    'total_size_gb': tables_df['size_gb'].sum() if not tables_df.empty else 0,
-    'total_rows': tables_df['row_count'].sum() if not tables_df.empty else 0,
-    'largest_table': tables_df.loc[tables_df['size_gb'].idxmax(), 'table'] if not tables_df.empty and tables_df['size_gb'].max() > 0 else None,
-    'most_rows_table': tables_df.loc[tables_df['row_count'].idxmax(), 'table'] if not tables_df.empty and tables_df['row_count'].max() > 0 else None
+    'total_tables': n_total,
+    'tables_with_data': n_with,
+    'total_size_gb': float(size_stats['sum']) if not tables_df.empty else 0,
+    'total_rows': int(row_stats['sum']) if not tables_df.empty else 0,
+    'largest_table': largest_table if not tables_df.empty and size_stats['max'] > 0 else None,
+    'most_rows_table': most_rows_table if not tables_df.empty and row_stats['max'] > 0 else None
 }
 
-# Save to JSON
-with open(f"{output_path}_summary.json", 'w') as f:
-    json.dump(summary_stats, f, indent=2, default=str)
+# Nested dict columns are encoded as JSON text so every column has a single Arrow type
+export_df = tables_df.assign(**{
+    column: tables_df[column].map(lambda value: json.dumps(value, default=str), na_action='ignore')
+    for column in ('usage_stats', 'properties') if column in tables_df.columns
+})
 
-# Save detailed table data to CSV
-if not tables_df.empty:
-    tables_df.to_csv(f"{output_path}_tables.csv", index=False)
+# Save tables and summary to one Arrow IPC file, with the summary kept in the schema metadata
+export_table = pa.Table.from_pandas(export_df, preserve_index=False)
+export_table = export_table.replace_schema_metadata({
+    **(export_table.schema.metadata or {}),
+    b'summary': json.dumps(summary_stats, default=str).encode()
+})
+feather.write_feather(export_table, f"{output_path}.arrow", compression='lz4')
 
-print(f"Analysis results exported to:")
-print(f"  Summary: {output_path}_summary.json")
-print(f"  Tables: {output_path}_tables.csv")
+print(f"Analysis results exported to: {output_path}.arrow")
+print("  Tables load with pd.read_feather, the summary is stored under the 'summary' schema metadata key")
 
 # COMMAND ----------
 
@@ -375,9 +453,10 @@ print("=" * 50)
 
 if not tables_df.empty:
     # Calculate some key metrics
-    avg_size = tables_df['size_gb'].mean()
-    median_size = tables_df['size_gb'].median()
-    empty_tables_pct = ((~tables_df['has_data']).sum() / len(tables_df)) * 100
+    avg_size = size_stats['mean']
+    median_size = size_stats['median']
+    empty_tables_pct = (n_empty / n_total) * 100
+    view_count = int((tables_df['table_type'] == 'VIEW').sum())
     
     print(f"📊 Key Metrics:")
     print(f"  Average table size: {avg_size:.2f} GB")
@@ -389,14 +468,14 @@ if not tables_df.empty:
     if empty_tables_pct > 20:
         print(f"  • Consider reviewing empty tables ({empty_tables_pct:.1f}% of total)")
     
-    if tables_df['size_gb'].max() > 100:
-        print(f"  • Large tables detected (>{tables_df['size_gb'].max():.1f} GB) - consider partitioning")
+    if size_stats['max'] > 100:
+        print(f"  • Large tables detected (>{size_stats['max']:.1f} GB) - consider partitioning")
     
-    if len(tables_df[tables_df['table_type'] == 'VIEW']) > 0:
-        print(f"  • {len(tables_df[tables_df['table_type'] == 'VIEW'])} views found - verify they're still needed")
+    if view_count > 0:
+        print(f"  • {view_count} views found - verify they're still needed")
     
     if 'last_updated' in tables_df.columns:
-        old_tables = tables_df[tables_df['last_updated'] < (datetime.now() - timedelta(days=90))]
+        old_tables = tables_df[tables_df['last_updated'] < (pd.Timestamp.now(tz='UTC') - timedelta(days=90))]
         if len(old_tables) > 0:
             print(f"  • {len(old_tables)} tables haven't been updated in 90+ days")
 
@@ -12,6 +12,10 @@ class MetadataConfig:
     include_usage_stats: bool = True
     usage_days: int = 30
     
+    # Cached results are reused for this long before collecting again
+    use_cache: bool = True
+    cache_ttl_seconds: int = 3600
+    
     # Databricks connection settings
     server_hostname: Optional[str] = None
     http_path: Optional[str] = None
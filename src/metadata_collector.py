@@ -1,16 +1,98 @@
 import argparse
-import json
+import asyncio
+import functools
+import hashlib
+import inspect
 import logging
 import sys
+import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import asdict
 from pathlib import Path
 
-from unity_catalog_client import UnityCatalogClient, TableMetadata
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from results_io import NESTED_COLUMNS, load_results_parquet
+from unity_catalog_client import (
+    AsyncUnityCatalogClient, UnityCatalogClient, TableMetadata, TableMetadataBatch
+)
 from config import MetadataConfig
 
 
+# Columns that may mix datetimes and strings depending on which query produced them
+TIMESTAMP_COLUMNS = ('created_at', 'last_updated')
+
+# Schemas up to this many tables are summarised without building a DataFrame
+SMALL_SCHEMA_TABLES = 32
+
+# Location of cached collection results, one Parquet file and JSON sidecar per cache key
+CACHE_DIR = Path.home() / '.cache' / 'uc_meta'
+
+
+def _read_cache(collector: 'MetadataCollector') -> Optional[Dict[str, Any]]:
+    """Load cached results into the collector if caching is enabled and they are within the configured TTL"""
+    if not collector.config.use_cache:
+        return None
+    
+    cache_file = CACHE_DIR / f"{collector._cache_key()}.parquet"
+    if not cache_file.exists() or time.time() - cache_file.stat().st_mtime >= collector.config.cache_ttl_seconds:
+        return None
+    
+    try:
+        results, columns = load_results_parquet(str(cache_file))
+        collector._batch = TableMetadataBatch(columns)
+        results['tables'] = collector._batch.to_records()
+        collector.results = results
+        collector.logger.info(f"Loaded cached metadata from {cache_file}")
+        return collector.results
+    except Exception as e:
+        collector.logger.warning(f"Could not read metadata cache {cache_file}: {e}")
+        return None
+
+
+def _write_cache(collector: 'MetadataCollector'):
+    if not collector.config.use_cache:
+        return
+    
+    cache_file = CACHE_DIR / f"{collector._cache_key()}.parquet"
+    try:
+        collector.save_results_parquet(str(cache_file))
+    except Exception as e:
+        collector.logger.warning(f"Could not write metadata cache {cache_file}: {e}")
+
+
+def cached_collection(collect):
+    """Serve collect_metadata or acollect_metadata from the on-disk cache while the cached results are within the configured TTL"""
+    if inspect.iscoroutinefunction(collect):
+        @functools.wraps(collect)
+        async def async_wrapper(self) -> Dict[str, Any]:
+            cached = await asyncio.to_thread(_read_cache, self)
+            if cached is not None:
+                return cached
+            
+            results = await collect(self)
+            await asyncio.to_thread(_write_cache, self)
+            return results
+        
+        return async_wrapper
+    
+    @functools.wraps(collect)
+    def wrapper(self) -> Dict[str, Any]:
+        cached = _read_cache(self)
+        if cached is not None:
+            return cached
+        
+        results = collect(self)
+        _write_cache(self)
+        return results
+    
+    return wrapper
+
+
 class MetadataCollector:
     """Collects and processes Unity Catalog metadata for tables within a schema"""
     
@@ -24,6 +106,8 @@ class MetadataCollector:
             'tables': [],
             'summary': {}
         }
+        # The collected tables column-wise, which the Parquet writer uses directly
+        self._batch = TableMetadataBatch.from_tables([])
     
     def _setup_logging(self) -> logging.Logger:
         logging.basicConfig(
@@ -32,6 +116,18 @@ class MetadataCollector:
         )
         return logging.getLogger(__name__)
     
+    def _cache_key(self) -> str:
+        """Identify cached results by the settings that affect what gets collected"""
+        key = (
+            self.config.server_hostname,
+            self.config.catalog,
+            self.config.schema,
+            self.config.usage_days,
+            self.config.include_usage_stats
+        )
+        return hashlib.sha256(repr(key).encode()).hexdigest()[:16]
+    
+    @cached_collection
     def collect_metadata(self) -> Dict[str, Any]:
         """Main method to collect metadata for all tables in the specified schema"""
         self.logger.info(f"Starting metadata collection for {self.config.catalog}.{self.config.schema}")
@@ -39,65 +135,110 @@ class MetadataCollector:
         try:
             with UnityCatalogClient() as client:
                 # Verify catalog and schema exist
-                catalogs = client.list_catalogs()
-                if self.config.catalog not in catalogs:
-                    raise ValueError(f"Catalog '{self.config.catalog}' not found. Available: {catalogs}")
-                
-                schemas = client.list_schemas(self.config.catalog)
-                if self.config.schema not in schemas:
-                    raise ValueError(f"Schema '{self.config.schema}' not found in {self.config.catalog}. Available: {schemas}")
+                self._verify_catalog(client.list_catalogs())
+                self._verify_schema(client.list_schemas(self.config.catalog))
                 
                 # Collect table metadata
                 table_metadata = client.get_schema_metadata(self.config.catalog, self.config.schema)
                 
-                # Process and enrich metadata
-                processed_tables = []
-                for table_meta in table_metadata:
-                    processed_table = self._process_table_metadata(client, table_meta)
-                    processed_tables.append(processed_table)
+                # Fetch usage statistics for the whole schema in one query
+                usage_stats = {}
+                if self.config.include_usage_stats:
+                    usage_stats = client.get_schema_usage_stats(
+                        self.config.catalog,
+                        self.config.schema,
+                        days=self.config.usage_days
+                    )
                 
-                self.results['tables'] = processed_tables
-                self.results['summary'] = self._generate_summary(processed_tables)
+                return self._store_results(table_metadata, usage_stats)
                 
-                self.logger.info(f"Collection completed. Found {len(processed_tables)} tables")
-                return self.results
+        except Exception as e:
+            self.logger.error(f"Metadata collection failed: {e}")
+            self.results['error'] = str(e)
+            raise
+    
+    @cached_collection
+    async def acollect_metadata(self) -> Dict[str, Any]:
+        """Collect metadata like collect_metadata, running the table and usage queries concurrently"""
+        self.logger.info(f"Starting metadata collection for {self.config.catalog}.{self.config.schema}")
+        
+        try:
+            async with AsyncUnityCatalogClient() as client:
+                # Verify catalog and schema exist
+                self._verify_catalog(await client.list_catalogs())
+                self._verify_schema(await client.list_schemas(self.config.catalog))
+                
+                # Collect table metadata and usage statistics at the same time
+                if self.config.include_usage_stats:
+                    table_metadata, usage_stats = await asyncio.gather(
+                        client.get_schema_metadata(self.config.catalog, self.config.schema),
+                        client.get_schema_usage_stats(
+                            self.config.catalog,
+                            self.config.schema,
+                            days=self.config.usage_days
+                        )
+                    )
+                else:
+                    table_metadata = await client.get_schema_metadata(self.config.catalog, self.config.schema)
+                    usage_stats = {}
+                
+                return self._store_results(table_metadata, usage_stats)
                 
         except Exception as e:
             self.logger.error(f"Metadata collection failed: {e}")
             self.results['error'] = str(e)
             raise
     
-    def _process_table_metadata(self, client: UnityCatalogClient, 
-                              table_meta: TableMetadata) -> Dict[str, Any]:
-        """Process and enrich individual table metadata"""
-        table_dict = asdict(table_meta)
+    def _verify_catalog(self, catalogs: List[str]):
+        if self.config.catalog not in catalogs:
+            raise ValueError(f"Catalog '{self.config.catalog}' not found. Available: {catalogs}")
+    
+    def _verify_schema(self, schemas: List[str]):
+        if self.config.schema not in schemas:
+            raise ValueError(f"Schema '{self.config.schema}' not found in {self.config.catalog}. Available: {schemas}")
+    
+    def _store_results(self, table_metadata: List[TableMetadata],
+                       usage_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Process and enrich metadata column-wise and record it in the results"""
+        batch = TableMetadataBatch.from_tables(table_metadata)
+        self._enrich_batch(batch, usage_stats)
+        
+        self._batch = batch
+        self.results['tables'] = batch.to_records()
+        self.results['summary'] = self._generate_summary(batch)
         
+        self.logger.info(f"Collection completed. Found {len(batch)} tables")
+        return self.results
+    
+    def _enrich_batch(self, batch: TableMetadataBatch,
+                      usage_stats: Dict[str, Dict[str, Any]]):
+        """Add usage statistics and computed columns to the table metadata"""
         # Add usage statistics if available
         if self.config.include_usage_stats:
-            try:
-                usage_stats = client.get_table_usage_stats(
-                    table_meta.catalog, 
-                    table_meta.schema, 
-                    table_meta.table,
-                    days=self.config.usage_days
-                )
-                table_dict['usage_stats'] = usage_stats
-            except Exception as e:
-                self.logger.warning(f"Could not get usage stats for {table_meta.table}: {e}")
-                table_dict['usage_stats'] = {}
+            stats = [usage_stats.get(table, {}) for table in batch.columns['table']]
+            last_accessed = self._to_iso_timestamps([table_stats.get('last_accessed') for table_stats in stats])
+            batch.columns['usage_stats'] = [
+                {**table_stats, 'last_accessed': accessed} if table_stats else table_stats
+                for table_stats, accessed in zip(stats, last_accessed)
+            ]
         
         # Add computed fields
-        table_dict['size_mb'] = self._bytes_to_mb(table_meta.size_bytes)
-        table_dict['size_gb'] = self._bytes_to_gb(table_meta.size_bytes)
-        table_dict['has_data'] = table_meta.row_count is not None and table_meta.row_count > 0
+        row_counts = pd.to_numeric(pd.Series(batch.columns['row_count'], dtype=object), errors='coerce')
+        batch.columns['has_data'] = (row_counts > 0).tolist()
         
-        return table_dict
+        # Store every timestamp the same way, whichever query produced it
+        for column in TIMESTAMP_COLUMNS:
+            batch.columns[column] = self._to_iso_timestamps(batch.columns[column])
     
-    def _bytes_to_mb(self, size_bytes: Optional[int]) -> Optional[float]:
-        """Convert bytes to megabytes"""
-        if size_bytes is None:
-            return None
-        return round(size_bytes / (1024 * 1024), 2)
+    def _to_iso_timestamps(self, values: List[Any]) -> List[Optional[str]]:
+        """Render timestamps as UTC ISO-8601 text"""
+        # format='mixed' also reads DESCRIBE TABLE EXTENDED text such as "Wed Jun 14 17:33:48 UTC 2023"
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), format='mixed', utc=True, errors='coerce')
+        return [
+            # Text that does not parse is kept as is
+            value if pd.isna(timestamp) else timestamp.isoformat()
+            for value, timestamp in zip(values, parsed)
+        ]
     
     def _bytes_to_gb(self, size_bytes: Optional[int]) -> Optional[float]:
         """Convert bytes to gigabytes"""
@@ -105,34 +246,75 @@ class MetadataCollector:
             return None
         return round(size_bytes / (1024 * 1024 * 1024), 2)
     
-    def _generate_summary(self, tables: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _generate_summary(self, batch: TableMetadataBatch) -> Dict[str, Any]:
         """Generate summary statistics for the collected metadata"""
-        if not tables:
+        if not len(batch):
             return {'total_tables': 0}
         
-        total_tables = len(tables)
-        tables_with_data = sum(1 for t in tables if t.get('has_data', False))
+        if len(batch) <= SMALL_SCHEMA_TABLES:
+            return self._generate_small_summary(batch)
         
-        # Size statistics
-        sizes = [t.get('size_bytes') for t in tables if t.get('size_bytes') is not None]
-        total_size_bytes = sum(sizes) if sizes else 0
+        # Aggregate column-wise instead of walking the rows
+        df = pd.DataFrame(batch.columns)
         
-        # Row count statistics
-        row_counts = [t.get('row_count') for t in tables if t.get('row_count') is not None]
-        total_rows = sum(row_counts) if row_counts else 0
+        # Size and row count statistics
+        sizes = pd.to_numeric(df['size_bytes'], errors='coerce').to_numpy(dtype='float64')
+        row_counts = pd.to_numeric(df['row_count'], errors='coerce').to_numpy(dtype='float64')
         
-        # Table types
+        return self._build_summary(
+            total_tables=len(df),
+            tables_with_data=int(df['has_data'].sum()),
+            total_size_bytes=int(np.nansum(sizes)),
+            total_rows=int(np.nansum(row_counts)),
+            table_types=self._count_values(df['table_type']),
+            data_formats=self._count_values(df['data_source_format']),
+            largest_table=self._table_at_max(batch.columns['table'], sizes),
+            most_rows=self._table_at_max(batch.columns['table'], row_counts)
+        )
+    
+    def _generate_small_summary(self, batch: TableMetadataBatch) -> Dict[str, Any]:
+        """Generate summary statistics in a single Python pass, cheaper than a DataFrame for a few tables"""
+        columns = batch.columns
+        tables_with_data = 0
+        total_size_bytes = 0
+        total_rows = 0
         table_types = {}
-        for table in tables:
-            table_type = table.get('table_type', 'UNKNOWN')
-            table_types[table_type] = table_types.get(table_type, 0) + 1
-        
-        # Data formats
         data_formats = {}
-        for table in tables:
-            format_type = table.get('data_source_format', 'UNKNOWN')
+        largest_table, largest_size = None, None
+        most_rows, most_row_count = None, None
+        
+        for table, size_bytes, row_count, has_data, table_type, format_type in zip(
+                columns['table'], columns['size_bytes'], columns['row_count'],
+                columns['has_data'], columns['table_type'], columns['data_source_format']):
+            if has_data:
+                tables_with_data += 1
+            if size_bytes is not None:
+                total_size_bytes += size_bytes
+                if largest_size is None or size_bytes > largest_size:
+                    largest_table, largest_size = table, size_bytes
+            if row_count is not None:
+                total_rows += row_count
+                if most_row_count is None or row_count > most_row_count:
+                    most_rows, most_row_count = table, row_count
+            table_type = table_type if table_type is not None else 'UNKNOWN'
+            table_types[table_type] = table_types.get(table_type, 0) + 1
+            format_type = format_type if format_type is not None else 'UNKNOWN'
             data_formats[format_type] = data_formats.get(format_type, 0) + 1
         
+        return self._build_summary(
+            total_tables=len(batch),
+            tables_with_data=tables_with_data,
+            total_size_bytes=int(total_size_bytes),
+            total_rows=int(total_rows),
+            table_types=table_types,
+            data_formats=data_formats,
+            largest_table=largest_table,
+            most_rows=most_rows
+        )
+    
+    def _build_summary(self, total_tables: int, tables_with_data: int, total_size_bytes: int,
+                       total_rows: int, table_types: Dict[str, int], data_formats: Dict[str, int],
+                       largest_table: Optional[str], most_rows: Optional[str]) -> Dict[str, Any]:
         return {
             'total_tables': total_tables,
             'tables_with_data': tables_with_data,
@@ -143,25 +325,74 @@ class MetadataCollector:
             'average_rows_per_table': round(total_rows / total_tables, 2) if total_tables > 0 else 0,
             'table_types': table_types,
             'data_formats': data_formats,
-            'largest_table': max(tables, key=lambda t: t.get('size_bytes', 0), default={}).get('table'),
-            'most_rows': max(tables, key=lambda t: t.get('row_count', 0), default={}).get('table')
+            'largest_table': largest_table,
+            'most_rows': most_rows
         }
     
+    def _table_at_max(self, table_names: List[str], values: np.ndarray) -> Optional[str]:
+        """Return the name of the table holding the largest non-missing value"""
+        if np.isnan(values).all():
+            return None
+        return table_names[int(np.nanargmax(values))]
+    
+    def _count_values(self, column: pd.Series) -> Dict[str, int]:
+        """Count occurrences of each value in a column, grouping missing values as UNKNOWN"""
+        counts = column.fillna('UNKNOWN').value_counts()
+        return {key: int(count) for key, count in counts.items()}
+    
+    def _default_output_path(self, suffix: str) -> str:
+        """Name output after the catalog, schema and collection time, so JSON and Parquet files of one run share a stem"""
+        timestamp = datetime.fromisoformat(self.results['collection_timestamp']).strftime("%Y%m%d_%H%M%S")
+        return f"metadata_collection_{self.config.catalog}_{self.config.schema}_{timestamp}{suffix}"
+    
     def save_results(self, output_path: Optional[str] = None) -> str:
         """Save collection results to a JSON file"""
         if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"metadata_collection_{self.config.catalog}_{self.config.schema}_{timestamp}.json"
+            output_path = self._default_output_path('.json')
+        
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        output_file.write_bytes(orjson.dumps(
+            self.results,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ))
+        
+        self.logger.info(f"Results saved to {output_file}")
+        return str(output_file)
+    
+    def save_results_parquet(self, output_path: Optional[str] = None) -> str:
+        """Save collected tables to a Parquet file with the remaining results in a JSON sidecar"""
+        if output_path is None:
+            output_path = self._default_output_path('.parquet')
         
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2, default=str)
+        # Nested columns are stored as JSON text so Parquet gets a single type per column
+        columns = dict(self._batch.columns)
+        for column in NESTED_COLUMNS:
+            if column in columns:
+                columns[column] = [None if value is None else self._to_json_text(value) for value in columns[column]]
+        
+        # Build the Arrow table from the lists directly, which keeps integer columns holding None as integers
+        pq.write_table(pa.Table.from_pydict(columns), output_file, compression='zstd')
+        
+        sidecar = {key: value for key, value in self.results.items() if key != 'tables'}
+        Path(f"{output_file}.meta.json").write_bytes(orjson.dumps(
+            sidecar,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+        ))
         
         self.logger.info(f"Results saved to {output_file}")
         return str(output_file)
     
+    def _to_json_text(self, value: Any) -> str:
+        """Encode a nested cell as JSON text"""
+        return orjson.dumps(value, default=str, option=orjson.OPT_NAIVE_UTC).decode()
+    
     def print_summary(self):
         """Print a formatted summary of the collection results"""
         summary = self.results.get('summary', {})
@@ -221,6 +452,10 @@ def main():
                        help='Include table usage statistics')
     parser.add_argument('--usage-days', type=int, default=30,
                        help='Number of days for usage statistics')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached results and collect fresh metadata')
+    parser.add_argument('--format', default='json', choices=['json', 'parquet', 'both'],
+                       help='Output format; both writes a Parquet file next to the JSON one')
     
     args = parser.parse_args()
     
@@ -229,7 +464,8 @@ def main():
         schema=args.schema,
         log_level=args.log_level,
         include_usage_stats=args.include_usage_stats,
-        usage_days=args.usage_days
+        usage_days=args.usage_days,
+        use_cache=not args.no_cache
     )
     
     collector = MetadataCollector(config)
@@ -238,11 +474,16 @@ def main():
         collector.collect_metadata()
         collector.print_summary()
         
-        if args.output:
-            collector.save_results(args.output)
-        else:
-            output_file = collector.save_results()
-            print(f"\n💾 Results saved to: {output_file}")
+        output_files = []
+        if args.format in ('json', 'both'):
+            output_files.append(collector.save_results(args.output))
+        if args.format in ('parquet', 'both'):
+            parquet_path = str(Path(args.output).with_suffix('.parquet')) if args.output else None
+            output_files.append(collector.save_results_parquet(parquet_path))
+        
+        if not args.output:
+            for output_file in output_files:
+                print(f"\n💾 Results saved to: {output_file}")
     
     except Exception as e:
         logging.error(f"Collection failed: {e}")
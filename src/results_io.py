@@ -0,0 +1,23 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import orjson
+import pyarrow.parquet as pq
+
+
+# Columns holding dicts, decoded from JSON text when read back from Parquet
+NESTED_COLUMNS = ('usage_stats', 'properties')
+
+
+def load_results_parquet(path: str) -> Tuple[Dict[str, Any], Dict[str, List[Any]]]:
+    """Load collection results written by MetadataCollector.save_results_parquet, with the tables as columns"""
+    parquet_file = Path(path)
+    results = orjson.loads(Path(f"{parquet_file}.meta.json").read_bytes())
+    
+    # Read columns straight from Arrow so nullable integer columns stay integers
+    columns = pq.read_table(parquet_file).to_pydict()
+    for column in NESTED_COLUMNS:
+        if column in columns:
+            columns[column] = [None if value is None else orjson.loads(value) for value in columns[column]]
+    
+    return results, columns
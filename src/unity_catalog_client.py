@@ -1,14 +1,25 @@
+import asyncio
+import functools
 import os
-import json
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from databricks.sql import connect
-from databricks import sql
+import operator
+import queue
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, fields, replace
+from cachetools import TTLCache, cachedmethod
+from databricks.sql import connect as _db_connect
+from databricks.sql.exc import OperationalError
+import pyarrow as pa
 import requests
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TableMetadata:
     catalog: str
     schema: str
@@ -25,15 +36,95 @@ class TableMetadata:
     properties: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class TableMetadataBatch:
+    """Metadata for many tables held column-wise, one list per TableMetadata field"""
+    columns: Dict[str, List[Any]]
+    
+    @classmethod
+    def from_tables(cls, tables: List[TableMetadata]) -> 'TableMetadataBatch':
+        return cls({
+            field.name: [getattr(table, field.name) for table in tables]
+            for field in fields(TableMetadata)
+        })
+    
+    def __len__(self) -> int:
+        return len(self.columns['table'])
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert to one dict per table"""
+        names = list(self.columns)
+        return [dict(zip(names, values)) for values in zip(*self.columns.values())]
+
+
+# DESCRIBE TABLE EXTENDED rows copied into get_table_info, keyed by their snake_case name
+_INFO_KEYS = frozenset({'Type', 'Provider', 'Location', 'Owner', 'Created Time', 'Last Access'})
+_INFO_RENAME = {key: key.lower().replace(' ', '_') for key in _INFO_KEYS}
+
+# Byte and row counts in the Statistics row, e.g. "1024 bytes, 10 rows"
+_STATS_RE = re.compile(r'^(?:(\d+)\s+bytes)?(?:.*?(\d+)\s+rows)?')
+
+# Catalog topology changes rarely, per-table DESCRIBE output is refreshed more often
+LISTING_CACHE_TTL = 300
+TABLE_CACHE_TTL = 60
+
+# Rows pulled from the driver per fetchmany call when iterating a result set
+FETCH_ARRAYSIZE = 10_000
+
+
 class UnityCtDataMissingError(Exception):
     pass
 
 
+def _q(identifier: str) -> str:
+    """Quote a single SQL identifier with backticks"""
+    return f"`{identifier.replace('`', '``')}`"
+
+
+def _dict_row_factory(columns: Tuple[str, ...]) -> Callable[[tuple], Dict[str, Any]]:
+    """Convert result rows to dicts keyed by column name"""
+    return lambda row: dict(zip(columns, row))
+
+
+@functools.lru_cache(maxsize=None)
+def _metadata_row_factory(columns: Tuple[str, ...]) -> Callable[[tuple], TableMetadata]:
+    """Convert result rows whose columns are named after TableMetadata fields, reading each field by position"""
+    # Fields the query does not return read the None appended to every row
+    getter = operator.itemgetter(*(
+        columns.index(name) if name in columns else -1 for name in TableMetadata.__slots__
+    ))
+    return lambda row: TableMetadata(*getter((*row, None)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_name(*parts: str) -> str:
+    """Quote a dotted object name such as catalog.schema.table for statements that cannot bind identifiers"""
+    return '.'.join(_q(part) for part in parts)
+
+
+def _rows_by(results: List[Dict[str, Any]], key_column: str) -> Dict[Any, Dict[str, Any]]:
+    """Key result rows by one of their columns, removing that column from each row"""
+    return {row.pop(key_column): row for row in results}
+
+
+def _is_permission_error(error: Exception) -> bool:
+    """Whether an error means the current principal may not read the queried object"""
+    message = str(error)
+    return 'PERMISSION_DENIED' in message or 'INSUFFICIENT_PERMISSIONS' in message
+
+
+def _is_stale_session(error: Exception) -> bool:
+    """Whether an error means the connection's session expired and the connection should be replaced"""
+    return isinstance(error, OperationalError) or 'SessionHandle' in str(error)
+
+
 class UnityCatalogClient:
     def __init__(self, 
                  server_hostname: Optional[str] = None,
                  http_path: Optional[str] = None,
-                 access_token: Optional[str] = None):
+                 access_token: Optional[str] = None,
+                 max_workers: int = 16,
+                 pool_size: int = 8):
         self.server_hostname = server_hostname or os.getenv('DATABRICKS_SERVER_HOSTNAME')
         self.http_path = http_path or os.getenv('DATABRICKS_HTTP_PATH')
         self.access_token = access_token or os.getenv('DATABRICKS_TOKEN')
@@ -41,104 +132,345 @@ class UnityCatalogClient:
         if not all([self.server_hostname, self.http_path, self.access_token]):
             raise ValueError("Missing required Databricks connection parameters")
         
-        self.logger = logging.getLogger(__name__)
-        self._connection = None
+        self.max_workers = max_workers
+        self.pool_size = pool_size
+        # Connections are not thread-safe, so each query checks one out of the pool
+        self._pool = queue.Queue()
+        self._pool_lock = threading.Lock()
+        self._open_connections = 0
+        self._active = False
+        # One cursor is kept open per pooled connection and reused by whichever thread holds it
+        self._cursors = {}
+        
+        self._cache_lock = threading.Lock()
+        self._catalogs_cache = TTLCache(maxsize=1, ttl=LISTING_CACHE_TTL)
+        self._schemas_cache = TTLCache(maxsize=1024, ttl=LISTING_CACHE_TTL)
+        self._tables_cache = TTLCache(maxsize=1024, ttl=LISTING_CACHE_TTL)
+        self._table_types_cache = TTLCache(maxsize=1024, ttl=LISTING_CACHE_TTL)
+        self._table_info_cache = TTLCache(maxsize=4096, ttl=TABLE_CACHE_TTL)
+        self._table_detail_cache = TTLCache(maxsize=4096, ttl=TABLE_CACHE_TTL)
+    
+    def invalidate(self, catalog: Optional[str] = None, schema: Optional[str] = None):
+        """Drop cached catalog, schema and table lookups, optionally only those under a catalog or schema"""
+        # Cache keys start with the catalog, so a schema alone cannot be matched against them
+        if schema is not None and catalog is None:
+            raise ValueError("A schema can only be invalidated together with its catalog")
+        scope = tuple(name for name in (catalog, schema) if name is not None)
+        with self._cache_lock:
+            if not scope:
+                self._catalogs_cache.clear()
+            for cache in (self._schemas_cache, self._tables_cache, self._table_types_cache,
+                          self._table_info_cache, self._table_detail_cache):
+                for key in [key for key in cache if tuple(key[:len(scope)]) == scope]:
+                    del cache[key]
     
     def __enter__(self):
-        self._connection = connect(
-            server_hostname=self.server_hostname,
-            http_path=self.http_path,
-            access_token=self.access_token
-        )
+        self._reserve_slot()
+        self._pool.put(self._open_connection())
+        # Only mark the client usable once the first connection is open
+        self._active = True
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._connection:
-            self._connection.close()
+        self._active = False
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._close_connection(connection)
+    
+    def _reserve_slot(self) -> bool:
+        """Claim room in the pool for one more connection, if it is below pool_size"""
+        with self._pool_lock:
+            if self._open_connections >= self.pool_size:
+                return False
+            self._open_connections += 1
+            return True
+    
+    def _open_connection(self):
+        """Open a connection for a slot already claimed with _reserve_slot"""
+        try:
+            return _db_connect(
+                server_hostname=self.server_hostname,
+                http_path=self.http_path,
+                access_token=self.access_token
+            )
+        except Exception:
+            with self._pool_lock:
+                self._open_connections -= 1
+            raise
+    
+    def _close_connection(self, connection):
+        with self._pool_lock:
+            self._open_connections -= 1
+        self._drop_cursor(connection)
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing connection: {e}")
     
-    def _execute_query(self, query: str) -> List[Dict[str, Any]]:
-        if not self._connection:
+    def _checkout(self, fresh: bool = False):
+        """Take an idle connection from the pool, or open a new one while below pool_size"""
+        if not self._active:
             raise RuntimeError("Client not initialized. Use within context manager.")
         
-        cursor = self._connection.cursor()
+        while True:
+            # Idle connections may have gone stale, so a fresh connection never reuses one
+            if not fresh:
+                try:
+                    return self._pool.get_nowait()
+                except queue.Empty:
+                    pass
+            
+            if self._reserve_slot():
+                return self._open_connection()
+            
+            # Wait for a connection to be released, re-checking for room in case one was discarded
+            try:
+                connection = self._pool.get(timeout=1)
+            except queue.Empty:
+                continue
+            if not fresh:
+                return connection
+            # The pool is full, so close an idle connection to make room for the fresh one
+            self._close_connection(connection)
+    
+    @contextmanager
+    def _acquire(self, fresh: bool = False):
+        """Check out a pooled connection, discarding it instead of returning it if its session went stale"""
+        connection = self._checkout(fresh)
         try:
-            self.logger.debug(f"Executing query: {query}")
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            for row in cursor.fetchall():
-                results.append(dict(zip(columns, row)))
-            return results
+            yield connection
+        except Exception as e:
+            if _is_stale_session(e):
+                self._close_connection(connection)
+                connection = None
+            raise
         finally:
+            if connection is not None:
+                self._release(connection)
+    
+    @contextmanager
+    def _cursor(self, fresh: bool = False):
+        """Check out a pooled connection and yield its cached cursor, replacing the cursor after a failed query"""
+        with self._acquire(fresh) as connection:
+            cursor = self._cursors.get(connection)
+            if cursor is None:
+                cursor = self._cursors[connection] = connection.cursor()
+                cursor.arraysize = FETCH_ARRAYSIZE
+            try:
+                yield cursor
+            except Exception:
+                self._drop_cursor(connection)
+                raise
+    
+    def _drop_cursor(self, connection):
+        cursor = self._cursors.pop(connection, None)
+        if cursor is None:
+            return
+        try:
             cursor.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing cursor: {e}")
+    
+    def _release(self, connection):
+        if self._active:
+            self._pool.put(connection)
+        else:
+            self._close_connection(connection)
+    
+    def _execute_query(self, query: str,
+                       parameters: Optional[Dict[str, Any]] = None,
+                       row_factory: Callable = _dict_row_factory) -> List[Any]:
+        return list(self._iter_query(query, parameters, row_factory))
     
+    def _iter_query(self, query: str,
+                    parameters: Optional[Dict[str, Any]] = None,
+                    row_factory: Callable = _dict_row_factory) -> Iterator[Any]:
+        """Yield result rows (dicts by default), holding a pooled connection until the generator is exhausted or closed"""
+        yielded = False
+        try:
+            for row in self._run_query(query, parameters, row_factory):
+                yielded = True
+                yield row
+        except Exception as e:
+            # Rows already handed out cannot be taken back, so only a failure before the first one is retried
+            if yielded or not _is_stale_session(e):
+                raise
+            logger.warning(f"Retrying query on a newly opened connection after stale session: {e}")
+            yield from self._run_query(query, parameters, row_factory, fresh=True)
+    
+    def _execute_query_arrow(self, query: str,
+                             parameters: Optional[Dict[str, Any]] = None) -> pa.Table:
+        """Execute a query and return the result as an Arrow table, without building a dict per row"""
+        return self._retry_stale_session(self._run_query_arrow, query, parameters)
+    
+    def _retry_stale_session(self, run: Callable, query: str,
+                             parameters: Optional[Dict[str, Any]]):
+        try:
+            return run(query, parameters)
+        except Exception as e:
+            if not _is_stale_session(e):
+                raise
+            logger.warning(f"Retrying query on a newly opened connection after stale session: {e}")
+            return run(query, parameters, fresh=True)
+    
+    def _run_query(self, query: str, parameters: Optional[Dict[str, Any]],
+                   row_factory: Callable, fresh: bool = False) -> Iterator[Any]:
+        with self._cursor(fresh) as cursor:
+            logger.debug(f"Executing query: {query}")
+            cursor.execute(query, parameters)
+            convert = row_factory(tuple(desc[0] for desc in cursor.description))
+            while True:
+                rows = cursor.fetchmany(FETCH_ARRAYSIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield convert(row)
+    
+    def _run_query_arrow(self, query: str,
+                         parameters: Optional[Dict[str, Any]] = None,
+                         fresh: bool = False) -> pa.Table:
+        with self._cursor(fresh) as cursor:
+            logger.debug(f"Executing query: {query}")
+            cursor.execute(query, parameters)
+            return cursor.fetchall_arrow()
+    
+    @cachedmethod(lambda self: self._catalogs_cache, lock=lambda self: self._cache_lock)
     def list_catalogs(self) -> List[str]:
         query = "SHOW CATALOGS"
         results = self._execute_query(query)
         return [row['catalog'] for row in results]
     
+    @cachedmethod(lambda self: self._schemas_cache, lock=lambda self: self._cache_lock)
     def list_schemas(self, catalog: str) -> List[str]:
-        query = f"SHOW SCHEMAS IN {catalog}"
+        query = f"SHOW SCHEMAS IN {_quote_name(catalog)}"
         results = self._execute_query(query)
         return [row['databaseName'] for row in results]
     
+    @cachedmethod(lambda self: self._tables_cache, lock=lambda self: self._cache_lock)
     def list_tables(self, catalog: str, schema: str) -> List[str]:
-        query = f"SHOW TABLES IN {catalog}.{schema}"
+        table_types = self._from_information_schema(self.list_tables_with_types, catalog, schema)
+        if table_types is None:
+            return self._show_tables(catalog, schema)
+        return list(table_types)
+    
+    def _show_tables(self, catalog: str, schema: str) -> List[str]:
+        query = f"SHOW TABLES IN {_quote_name(catalog, schema)}"
         results = self._execute_query(query)
         return [row['tableName'] for row in results]
     
+    def _from_information_schema(self, lookup: Callable[[str, str], Any],
+                                 catalog: str, schema: str) -> Optional[Any]:
+        """Run an information_schema lookup for a schema, or return None when SHOW TABLES must be used instead"""
+        try:
+            rows = lookup(catalog, schema)
+        except Exception as e:
+            if not _is_permission_error(e):
+                raise
+            logger.warning(f"Cannot read information_schema for {catalog}.{schema}, "
+                           f"falling back to SHOW TABLES: {e}")
+            return None
+        
+        # information_schema leaves out hive_metastore and silently hides tables the principal cannot see
+        return rows or None
+    
+    @cachedmethod(lambda self: self._table_types_cache, lock=lambda self: self._cache_lock)
+    def list_tables_with_types(self, catalog: str, schema: str) -> Dict[str, str]:
+        """Map each table in a schema to its type (MANAGED, EXTERNAL, VIEW, ...)"""
+        # Empty for catalogs information_schema does not cover, such as hive_metastore
+        query = """
+        SELECT table_name, table_type
+        FROM system.information_schema.tables
+        WHERE table_catalog = :catalog
+        AND table_schema = :schema
+        ORDER BY table_name
+        """
+        results = self._execute_query(query, {'catalog': catalog, 'schema': schema})
+        return {row['table_name']: row['table_type'] for row in results}
+    
+    @cachedmethod(lambda self: self._table_info_cache, lock=lambda self: self._cache_lock)
     def get_table_info(self, catalog: str, schema: str, table: str) -> Dict[str, Any]:
-        full_table_name = f"{catalog}.{schema}.{table}"
-        query = f"DESCRIBE TABLE EXTENDED {full_table_name}"
-        results = self._execute_query(query)
+        query = f"DESCRIBE TABLE EXTENDED {_quote_name(catalog, schema, table)}"
+        results = self._execute_query_arrow(query)
         
         info = {}
-        for row in results:
-            col_name = row.get('col_name', '').strip()
-            data_type = row.get('data_type', '').strip()
-            comment = row.get('comment', '').strip()
+        for col_name, data_type in zip(results.column('col_name').to_pylist(),
+                                       results.column('data_type').to_pylist()):
+            col_name = (col_name or '').strip()
+            data_type = (data_type or '').strip()
             
-            if col_name and not col_name.startswith('#'):
-                if col_name in ['Type', 'Provider', 'Location', 'Owner', 'Created Time', 'Last Access']:
-                    info[col_name.lower().replace(' ', '_')] = data_type
-                elif col_name == 'Statistics':
-                    if 'bytes' in data_type:
-                        try:
-                            info['size_bytes'] = int(data_type.split()[0])
-                        except (ValueError, IndexError):
-                            pass
-                    if 'rows' in data_type:
-                        try:
-                            parts = data_type.split()
-                            for i, part in enumerate(parts):
-                                if part == 'rows' and i > 0:
-                                    info['row_count'] = int(parts[i-1])
-                                    break
-                        except (ValueError, IndexError):
-                            pass
+            if col_name in _INFO_KEYS:
+                info[_INFO_RENAME[col_name]] = data_type
+            elif col_name == 'Statistics':
+                size_bytes, row_count = _STATS_RE.search(data_type).groups()
+                if size_bytes:
+                    info['size_bytes'] = int(size_bytes)
+                if row_count:
+                    info['row_count'] = int(row_count)
         
         return info
     
+    @cachedmethod(lambda self: self._table_detail_cache, lock=lambda self: self._cache_lock)
     def get_table_detail(self, catalog: str, schema: str, table: str) -> Dict[str, Any]:
         full_table_name = f"{catalog}.{schema}.{table}"
-        query = f"DESCRIBE DETAIL {full_table_name}"
+        query = f"DESCRIBE DETAIL {_quote_name(catalog, schema, table)}"
+        rows = self._iter_query(query)
         try:
-            results = self._execute_query(query)
-            return results[0] if results else {}
+            return next(rows, {})
         except Exception as e:
-            self.logger.warning(f"Could not get table detail for {full_table_name}: {e}")
+            logger.warning(f"Could not get table detail for {full_table_name}: {e}")
             return {}
+        finally:
+            # Release the pooled connection without draining the rest of the result set
+            rows.close()
     
-    def get_table_metadata(self, catalog: str, schema: str, table: str) -> TableMetadata:
-        full_table_name = f"{catalog}.{schema}.{table}"
+    def get_table_metadata(self, catalog: str, schema: str, table: str,
+                           table_type: Optional[str] = None,
+                           owner: Optional[str] = None) -> TableMetadata:
+        """Collect metadata for one table"""
+        # Known type and owner let Delta tables skip DESCRIBE TABLE EXTENDED
+        table_detail, table_info = self._describe_table(
+            catalog, schema, table, type_and_owner_known=table_type is not None and owner is not None
+        )
+        row_count, size_bytes = self._storage_stats(table_detail, table_info)
         
-        # Get basic table info
-        table_info = self.get_table_info(catalog, schema, table)
+        return TableMetadata(
+            catalog=catalog,
+            schema=schema,
+            table=table,
+            table_type=table_type or table_info.get('type', 'UNKNOWN'),
+            owner=owner or table_info.get('owner', 'UNKNOWN'),
+            created_at=table_detail.get('createdAt') or table_info.get('created_time'),
+            last_updated=table_detail.get('lastModified') or table_info.get('last_access'),
+            row_count=row_count,
+            size_bytes=size_bytes,
+            location=table_detail.get('location') or table_info.get('location'),
+            data_source_format=table_detail.get('format') or table_info.get('provider'),
+            comment=table_detail.get('comment'),
+            properties=table_detail.get('properties') if table_detail else None
+        )
+    
+    def _describe_table(self, catalog: str, schema: str, table: str,
+                        type_and_owner_known: bool,
+                        data_source_format: Optional[str] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run DESCRIBE DETAIL, and DESCRIBE TABLE EXTENDED only when DETAIL cannot cover the table"""
+        if data_source_format and data_source_format.upper() != 'DELTA':
+            # DESCRIBE DETAIL fails for anything but Delta, so go straight to DESCRIBE TABLE EXTENDED
+            table_detail = {}
+        else:
+            table_detail = self.get_table_detail(catalog, schema, table)
         
-        # Get detailed table information
-        table_detail = self.get_table_detail(catalog, schema, table)
+        # DESCRIBE DETAIL only answers for Delta tables and then has everything but type and owner
+        if table_detail and type_and_owner_known:
+            return table_detail, {}
         
-        # Try to get row count from table statistics
+        return table_detail, self.get_table_info(catalog, schema, table)
+    
+    def _storage_stats(self, table_detail: Dict[str, Any],
+                       table_info: Dict[str, Any]) -> Tuple[Optional[int], Optional[int]]:
+        """Pick row count and size, preferring DESCRIBE DETAIL over DESCRIBE TABLE EXTENDED statistics"""
         row_count = None
         size_bytes = None
         
@@ -153,36 +485,85 @@ class UnityCatalogClient:
         if size_bytes is None:
             size_bytes = table_info.get('size_bytes')
         
-        return TableMetadata(
-            catalog=catalog,
-            schema=schema,
-            table=table,
-            table_type=table_info.get('type', 'UNKNOWN'),
-            owner=table_info.get('owner', 'UNKNOWN'),
-            created_at=table_detail.get('createdAt') or table_info.get('created_time'),
-            last_updated=table_detail.get('lastModified') or table_info.get('last_access'),
+        return row_count, size_bytes
+    
+    def get_schema_metadata(self, catalog: str, schema: str) -> List[TableMetadata]:
+        rows = self._from_information_schema(self._bulk_schema_metadata, catalog, schema)
+        if rows is None:
+            return self._collect_tables(
+                catalog, schema, self._show_tables(catalog, schema),
+                lambda table: self.get_table_metadata(catalog, schema, table)
+            )
+        
+        rows_by_table = {row.table: row for row in rows}
+        return self._collect_tables(
+            catalog, schema, list(rows_by_table),
+            lambda table: self._add_storage_stats(rows_by_table[table])
+        )
+    
+    def _bulk_schema_metadata(self, catalog: str, schema: str) -> List[TableMetadata]:
+        """Fetch the descriptive metadata of every table in a schema with one information_schema query"""
+        query = """
+        SELECT 
+            table_catalog AS `catalog`,
+            table_schema AS `schema`,
+            table_name AS `table`,
+            table_type,
+            table_owner AS owner,
+            created AS created_at,
+            last_altered AS last_updated,
+            data_source_format,
+            storage_path AS location,
+            comment
+        FROM system.information_schema.tables 
+        WHERE table_catalog = :catalog
+        AND table_schema = :schema
+        ORDER BY table_name
+        """
+        return self._execute_query(query, {'catalog': catalog, 'schema': schema},
+                                   row_factory=_metadata_row_factory)
+    
+    def _add_storage_stats(self, row: TableMetadata) -> TableMetadata:
+        """Complete table metadata read from information_schema with size statistics from DESCRIBE"""
+        # information_schema has no storage statistics, which come from DESCRIBE instead
+        if row.table_type == 'VIEW':
+            # Views store no data, so there is nothing for DESCRIBE to add
+            table_detail, table_info = {}, {}
+        else:
+            table_detail, table_info = self._describe_table(
+                row.catalog, row.schema, row.table, type_and_owner_known=True,
+                data_source_format=row.data_source_format
+            )
+        row_count, size_bytes = self._storage_stats(table_detail, table_info)
+        
+        return replace(
+            row,
+            table_type=row.table_type or 'UNKNOWN',
+            owner=row.owner or 'UNKNOWN',
             row_count=row_count,
             size_bytes=size_bytes,
-            location=table_detail.get('location') or table_info.get('location'),
-            data_source_format=table_detail.get('format') or table_info.get('provider'),
-            comment=table_detail.get('comment'),
+            location=row.location or table_detail.get('location'),
+            data_source_format=row.data_source_format or table_detail.get('format'),
             properties=table_detail.get('properties') if table_detail else None
         )
     
-    def get_schema_metadata(self, catalog: str, schema: str) -> List[TableMetadata]:
-        tables = self.list_tables(catalog, schema)
-        metadata = []
+    def _collect_tables(self, catalog: str, schema: str, tables: List[str],
+                        build: Callable[[str], TableMetadata]) -> List[TableMetadata]:
+        """Build metadata for each table on a thread pool, keeping the input order and skipping failures"""
+        metadata = {}
         
-        for table in tables:
-            try:
-                table_metadata = self.get_table_metadata(catalog, schema, table)
-                metadata.append(table_metadata)
-                self.logger.info(f"Collected metadata for {catalog}.{schema}.{table}")
-            except Exception as e:
-                self.logger.error(f"Failed to collect metadata for {catalog}.{schema}.{table}: {e}")
-                continue
+        # Per-table DESCRIBE queries are I/O bound, so overlap them on a thread pool
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(build, table): table for table in tables}
+            for future in as_completed(futures):
+                table = futures[future]
+                try:
+                    metadata[table] = future.result()
+                    logger.info(f"Collected metadata for {catalog}.{schema}.{table}")
+                except Exception as e:
+                    logger.error(f"Failed to collect metadata for {catalog}.{schema}.{table}: {e}")
         
-        return metadata
+        return [metadata[table] for table in tables if table in metadata]
     
     def get_table_usage_stats(self, catalog: str, schema: str, table: str, 
                             days: int = 30) -> Dict[str, Any]:
@@ -190,19 +571,129 @@ class UnityCatalogClient:
         full_table_name = f"{catalog}.{schema}.{table}"
         
         # Query system.access.table_lineage for usage information
-        query = f"""
+        query = """
         SELECT 
             COUNT(*) as access_count,
             MAX(event_time) as last_accessed,
             COUNT(DISTINCT user_identity.email) as unique_users
         FROM system.access.table_lineage 
-        WHERE target_table_full_name = '{full_table_name}'
-        AND event_time >= CURRENT_TIMESTAMP() - INTERVAL {days} DAYS
+        WHERE target_table_full_name = :name
+        AND event_time >= CURRENT_TIMESTAMP() - MAKE_DT_INTERVAL(:days)
         """
         
         try:
-            results = self._execute_query(query)
+            results = self._execute_query(query, {'name': full_table_name, 'days': days})
             return results[0] if results else {}
         except Exception as e:
-            self.logger.warning(f"Could not get usage stats for {full_table_name}: {e}")
-            return {}
\ No newline at end of file
+            logger.warning(f"Could not get usage stats for {full_table_name}: {e}")
+            return {}
+    
+    def get_table_usage_stats_bulk(self, table_full_names: List[str],
+                                   days: int = 30) -> Dict[str, Dict[str, Any]]:
+        """Get usage statistics for many tables with one grouped query, keyed by full table name"""
+        if not table_full_names:
+            return {}
+        
+        parameters = {f"table_{i}": name for i, name in enumerate(table_full_names)}
+        parameters['days'] = days
+        placeholders = ', '.join(f":table_{i}" for i in range(len(table_full_names)))
+        
+        query = f"""
+        SELECT 
+            target_table_full_name,
+            COUNT(*) as access_count,
+            MAX(event_time) as last_accessed,
+            COUNT(DISTINCT user_identity.email) as unique_users
+        FROM system.access.table_lineage 
+        WHERE target_table_full_name IN ({placeholders})
+        AND event_time >= CURRENT_TIMESTAMP() - MAKE_DT_INTERVAL(:days)
+        GROUP BY target_table_full_name
+        """
+        
+        try:
+            results = self._execute_query(query, parameters)
+        except Exception as e:
+            logger.warning(f"Could not get usage stats for {len(table_full_names)} tables: {e}")
+            return {}
+        
+        return _rows_by(results, 'target_table_full_name')
+    
+    def get_schema_usage_stats(self, catalog: str, schema: str,
+                               days: int = 30) -> Dict[str, Dict[str, Any]]:
+        """Get usage statistics for every table in a schema with a single aggregated query"""
+        query = """
+        SELECT 
+            target_table_name as table_name,
+            COUNT(*) as access_count,
+            MAX(event_time) as last_accessed,
+            COUNT(DISTINCT user_identity.email) as unique_users
+        FROM system.access.table_lineage 
+        WHERE target_table_catalog = :catalog
+        AND target_table_schema = :schema
+        AND event_time >= CURRENT_TIMESTAMP() - MAKE_DT_INTERVAL(:days)
+        GROUP BY target_table_name
+        """
+        
+        try:
+            results = self._execute_query(query, {'catalog': catalog, 'schema': schema, 'days': days})
+        except Exception as e:
+            logger.warning(f"Could not get usage stats for {catalog}.{schema}: {e}")
+            return {}
+        
+        return _rows_by(results, 'table_name')
+
+
+class AsyncUnityCatalogClient:
+    """Asyncio interface to UnityCatalogClient, running each blocking call on a worker thread"""
+    
+    def __init__(self, client: Optional[UnityCatalogClient] = None, **client_kwargs):
+        self._client = client or UnityCatalogClient(**client_kwargs)
+    
+    async def __aenter__(self):
+        await asyncio.to_thread(self._client.__enter__)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.to_thread(self._client.__exit__, exc_type, exc_val, exc_tb)
+    
+    async def list_catalogs(self) -> List[str]:
+        return await asyncio.to_thread(self._client.list_catalogs)
+    
+    async def list_schemas(self, catalog: str) -> List[str]:
+        return await asyncio.to_thread(self._client.list_schemas, catalog)
+    
+    async def list_tables(self, catalog: str, schema: str) -> List[str]:
+        return await asyncio.to_thread(self._client.list_tables, catalog, schema)
+    
+    async def list_tables_with_types(self, catalog: str, schema: str) -> Dict[str, str]:
+        return await asyncio.to_thread(self._client.list_tables_with_types, catalog, schema)
+    
+    async def get_table_metadata(self, catalog: str, schema: str, table: str) -> TableMetadata:
+        return await asyncio.to_thread(self._client.get_table_metadata, catalog, schema, table)
+    
+    async def get_schema_metadata(self, catalog: str, schema: str) -> List[TableMetadata]:
+        return await asyncio.to_thread(self._client.get_schema_metadata, catalog, schema)
+    
+    async def get_tables_metadata(self, catalog: str, schema: str,
+                                  tables: Optional[List[str]] = None) -> List[TableMetadata]:
+        """Gather per-table metadata concurrently on the event loop, keeping the input order and skipping failures"""
+        if tables is None:
+            tables = await self.list_tables(catalog, schema)
+        
+        # Each lookup checks out its own pooled connection for the duration of its DESCRIBE queries
+        results = await asyncio.gather(
+            *(self.get_table_metadata(catalog, schema, table) for table in tables),
+            return_exceptions=True
+        )
+        
+        metadata = []
+        for table, result in zip(tables, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to collect metadata for {catalog}.{schema}.{table}: {result}")
+            else:
+                metadata.append(result)
+        return metadata
+    
+    async def get_schema_usage_stats(self, catalog: str, schema: str,
+                                     days: int = 30) -> Dict[str, Dict[str, Any]]:
+        return await asyncio.to_thread(self._client.get_schema_usage_stats, catalog, schema, days)
@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+
+pytest.importorskip('databricks.sql')
+
+import metadata_collector
+from config import MetadataConfig
+from metadata_collector import MetadataCollector
+from unity_catalog_client import TableMetadata
+
+
+TABLES = [
+    TableMetadata(catalog='main', schema='sales', table='orders', table_type='MANAGED', owner='alice',
+                  created_at=datetime.datetime(2024, 1, 1), last_updated=datetime.datetime(2024, 2, 1),
+                  row_count=1, size_bytes=1000, location='s3://bucket/orders',
+                  data_source_format='DELTA', properties={'delta.appendOnly': 'true'}),
+    TableMetadata(catalog='main', schema='sales', table='orders_view', table_type='VIEW', owner='bob',
+                  created_at='Wed Jun 14 17:33:48 UTC 2023', comment='open orders'),
+]
+
+USAGE_STATS = {
+    'orders': {'access_count': 5, 'last_accessed': datetime.datetime(2024, 3, 1), 'unique_users': 2},
+}
+
+
+class FakeClient:
+    """Stands in for UnityCatalogClient, counting schema metadata lookups"""
+    
+    calls = 0
+    tables = TABLES
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    
+    def list_catalogs(self):
+        return ['main']
+    
+    def list_schemas(self, catalog):
+        return ['sales']
+    
+    def get_schema_metadata(self, catalog, schema):
+        FakeClient.calls += 1
+        return list(self.tables)
+    
+    def get_schema_usage_stats(self, catalog, schema, days=30):
+        return USAGE_STATS
+
+
+@pytest.fixture
+def fake_client(monkeypatch, tmp_path):
+    monkeypatch.setattr(metadata_collector, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(metadata_collector, 'UnityCatalogClient', FakeClient)
+    monkeypatch.setattr(FakeClient, 'calls', 0)
+    return FakeClient
+
+
+def make_config():
+    return MetadataConfig(catalog='main', schema='sales', server_hostname='host', log_level='WARNING')
+
+
+def test_cached_results_match_a_fresh_collection(fake_client):
+    fresh = MetadataCollector(make_config()).collect_metadata()
+    cached = MetadataCollector(make_config()).collect_metadata()
+    
+    assert fake_client.calls == 1
+    assert cached['tables'] == fresh['tables']
+    assert cached['summary'] == fresh['summary']
+    
+    row_counts = [table['row_count'] for table in cached['tables']]
+    assert row_counts == [1, None]
+    assert type(row_counts[0]) is int
+    assert cached['tables'][1]['created_at'] == '2023-06-14T17:33:48+00:00'
+
+
+def test_cached_empty_schema_matches_a_fresh_collection(fake_client, monkeypatch):
+    monkeypatch.setattr(fake_client, 'tables', [])
+    
+    fresh = MetadataCollector(make_config()).collect_metadata()
+    cached = MetadataCollector(make_config()).collect_metadata()
+    
+    assert fake_client.calls == 1
+    assert cached['tables'] == fresh['tables'] == []
+    assert cached['summary'] == fresh['summary']
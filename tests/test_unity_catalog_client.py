@@ -0,0 +1,184 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip('databricks.sql')
+
+import unity_catalog_client
+from databricks.sql.exc import OperationalError
+from unity_catalog_client import TableMetadata, UnityCatalogClient
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.arraysize = 1
+        self._rows = []
+    
+    def execute(self, query, parameters=None):
+        # A connection must never be shared by two threads at once
+        assert not self.connection.busy, "connection used concurrently"
+        self.connection.busy = True
+        try:
+            if self.connection.stale:
+                raise OperationalError("Invalid SessionHandle")
+            self.description = [('value',)]
+            self._rows = [(1,)]
+        finally:
+            self.connection.busy = False
+    
+    def fetchmany(self, size=None):
+        rows, self._rows = self._rows, []
+        return rows
+    
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, stale=False):
+        self.busy = False
+        self.stale = stale
+        self.closed = False
+    
+    def cursor(self):
+        return FakeCursor(self)
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeConnector:
+    """Stands in for databricks.sql.connect, recording every connection it opens"""
+    
+    def __init__(self, stale_first=False, fail=False):
+        self.stale_first = stale_first
+        self.fail = fail
+        self.connections = []
+        self.max_open = 0
+        self._lock = threading.Lock()
+    
+    def __call__(self, **kwargs):
+        if self.fail:
+            raise OperationalError("Could not connect")
+        with self._lock:
+            connection = FakeConnection(stale=self.stale_first and not self.connections)
+            self.connections.append(connection)
+            open_count = sum(not c.closed for c in self.connections)
+            self.max_open = max(self.max_open, open_count)
+            return connection
+
+
+@pytest.fixture
+def connector(monkeypatch):
+    fake = FakeConnector(stale_first=True)
+    monkeypatch.setattr(unity_catalog_client, '_db_connect', fake)
+    return fake
+
+
+def make_client(pool_size=8):
+    return UnityCatalogClient(server_hostname='host', http_path='path', access_token='token',
+                              pool_size=pool_size)
+
+
+def test_concurrent_queries_share_a_bounded_pool(connector):
+    with make_client(pool_size=8) as client:
+        with ThreadPoolExecutor(max_workers=20) as executor:
+            results = list(executor.map(lambda _: client._execute_query("SELECT 1"), range(100)))
+    
+    assert results == [[{'value': 1}]] * 100
+    assert connector.max_open <= 8
+    assert connector.connections[0].stale and connector.connections[0].closed
+    assert all(connection.closed for connection in connector.connections)
+    assert client._open_connections == 0
+
+
+def test_retry_after_stale_session_uses_a_new_connection(monkeypatch):
+    connector = FakeConnector()
+    monkeypatch.setattr(unity_catalog_client, '_db_connect', connector)
+    
+    with make_client(pool_size=4) as client:
+        # Warm the pool, then let every session in it expire
+        warm = [client._checkout() for _ in range(4)]
+        for connection in warm:
+            client._release(connection)
+        for connection in connector.connections:
+            connection.stale = True
+        
+        results = [client._execute_query("SELECT 1") for _ in range(4)]
+    
+    assert results == [[{'value': 1}]] * 4
+    assert all(connection.closed for connection in warm)
+    assert connector.max_open <= 4
+
+
+def test_connection_released_after_exit_is_closed(connector):
+    client = make_client()
+    with client:
+        connection = client._checkout()
+    
+    assert not connection.closed
+    client._release(connection)
+    assert connection.closed
+    assert client._open_connections == 0
+
+
+def test_queries_require_context_manager(connector):
+    with pytest.raises(RuntimeError):
+        make_client()._execute_query("SELECT 1")
+
+
+def test_failed_first_connect_leaves_client_inactive(monkeypatch):
+    monkeypatch.setattr(unity_catalog_client, '_db_connect', FakeConnector(fail=True))
+    client = make_client()
+    
+    with pytest.raises(OperationalError):
+        client.__enter__()
+    
+    assert not client._active
+    assert client._open_connections == 0
+
+
+def test_invalidate_drops_only_keys_under_the_scope():
+    client = make_client()
+    client._schemas_cache[('main',)] = ['s']
+    client._tables_cache[('main', 's')] = ['t001']
+    client._tables_cache[('s', 'other')] = ['t002']
+    client._table_info_cache[('main', 's', 't001')] = {}
+    
+    client.invalidate(catalog='main', schema='s')
+    
+    assert list(client._schemas_cache) == [('main',)]
+    assert list(client._tables_cache) == [('s', 'other')]
+    assert not client._table_info_cache
+
+
+def test_invalidate_rejects_schema_without_catalog():
+    with pytest.raises(ValueError):
+        make_client().invalidate(schema='s')
+
+
+@pytest.mark.parametrize('data_type, expected', [
+    ('1024 bytes, 10 rows', ('1024', '10')),
+    ('1024 bytes', ('1024', None)),
+    ('10 rows', (None, '10')),
+    ('', (None, None)),
+])
+def test_stats_regex_reads_bytes_and_rows(data_type, expected):
+    assert unity_catalog_client._STATS_RE.search(data_type).groups() == expected
+
+
+def test_metadata_row_factory_handles_missing_and_reordered_columns():
+    columns = ('table', 'owner', 'catalog', 'row_count', 'schema', 'table_type')
+    make_row = unity_catalog_client._metadata_row_factory(columns)
+    
+    table = make_row(('orders', 'alice', 'main', 10, 'sales', 'MANAGED'))
+    
+    assert table == TableMetadata(
+        catalog='main', schema='sales', table='orders', table_type='MANAGED',
+        owner='alice', row_count=10,
+    )
+    assert table.created_at is None
+    assert table.properties is None